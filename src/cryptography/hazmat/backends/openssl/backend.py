@@ -192,6 +192,7 @@ class Backend(BackendInterface):
 
         self._cipher_registry = {}
         self._register_default_ciphers()
+        self._evp_md_cache = {}
         self._register_x509_ext_parsers()
         self._register_x509_encoders()
         if self._fips_enabled and self._lib.CRYPTOGRAPHY_NEEDS_OSRANDOM_ENGINE:
@@ -295,8 +296,14 @@ class Backend(BackendInterface):
         else:
             alg = algorithm.name.encode("ascii")
 
-        evp_md = self._lib.EVP_get_digestbyname(alg)
-        return evp_md
+        try:
+            return self._evp_md_cache[alg]
+        except KeyError:
+            # EVP_get_digestbyname returns a pointer into a static table, so
+            # it's safe to hold on to it for the lifetime of the backend.
+            evp_md = self._lib.EVP_get_digestbyname(alg)
+            self._evp_md_cache[alg] = evp_md
+            return evp_md
 
     def _evp_md_non_null_from_algorithm(self, algorithm):
         evp_md = self._evp_md_from_algorithm(algorithm)
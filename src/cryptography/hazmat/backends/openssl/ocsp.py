@@ -3,6 +3,7 @@
 # for complete details.
 
 import datetime
+import functools
 import typing
 
 from cryptography import utils, x509
@@ -22,9 +23,7 @@ from cryptography.x509.ocsp import (
     OCSPRequest,
     OCSPResponse,
     OCSPResponseStatus,
-    _CERT_STATUS_TO_ENUM,
     _OIDS_TO_HASH,
-    _RESPONSE_STATUS_TO_ENUM,
 )
 
 
@@ -66,6 +65,13 @@ def _serial_number(backend, cert_id):
     return _asn1_integer_to_int(backend, num[0])
 
 
+@functools.lru_cache(maxsize=None)
+def _get_hash(oid: str) -> hashes.HashAlgorithm:
+    # Hash algorithm instances are stateless markers, so one shared instance
+    # per OID is enough for every response parsed in the process.
+    return _OIDS_TO_HASH[oid]()
+
+
 def _hash_algorithm(backend, cert_id):
     asn1obj = backend._ffi.new("ASN1_OBJECT **")
     res = backend._lib.OCSP_id_get0_info(
@@ -77,9 +83,12 @@ def _hash_algorithm(backend, cert_id):
     )
     backend.openssl_assert(res == 1)
     backend.openssl_assert(asn1obj[0] != backend._ffi.NULL)
+    # The decoded OID is attacker-controlled and unknown OIDs are expected
+    # here, so it must not be interned: the intern table would grow without
+    # bound. A plain dict lookup on a short string is already cheap.
     oid = _obj2txt(backend, asn1obj[0])
     try:
-        return _OIDS_TO_HASH[oid]
+        return _get_hash(oid)
     except KeyError:
         raise UnsupportedAlgorithm(
             "Signature algorithm OID: {} not recognized".format(oid)
@@ -91,8 +100,10 @@ class _OCSPResponse(OCSPResponse):
         self._backend = backend
         self._ocsp_response = ocsp_response
         status = self._backend._lib.OCSP_response_status(self._ocsp_response)
-        self._backend.openssl_assert(status in _RESPONSE_STATUS_TO_ENUM)
-        self._status = _RESPONSE_STATUS_TO_ENUM[status]
+        self._backend.openssl_assert(
+            status in OCSPResponseStatus._value2member_map_
+        )
+        self._status = OCSPResponseStatus(status)
         if self._status is OCSPResponseStatus.SUCCESSFUL:
             basic = self._backend._lib.OCSP_response_get1_basic(
                 self._ocsp_response
@@ -128,7 +139,7 @@ class _OCSPResponse(OCSPResponse):
                 "has no value"
             )
 
-    @property
+    @utils.cached_property
     def signature_algorithm_oid(self) -> x509.ObjectIdentifier:
         self._requires_successful_response()
         alg = self._backend._lib.OCSP_resp_get0_tbs_sigalg(self._basic)
@@ -136,7 +147,7 @@ class _OCSPResponse(OCSPResponse):
         oid = _obj2txt(self._backend, alg.algorithm)
         return x509.ObjectIdentifier(oid)
 
-    @property
+    @utils.cached_property
     def signature_hash_algorithm(
         self,
     ) -> typing.Optional[hashes.HashAlgorithm]:
@@ -149,14 +160,14 @@ class _OCSPResponse(OCSPResponse):
                 "Signature algorithm OID:{} not recognized".format(oid)
             )
 
-    @property
+    @utils.cached_property
     def signature(self) -> bytes:
         self._requires_successful_response()
         sig = self._backend._lib.OCSP_resp_get0_signature(self._basic)
         self._backend.openssl_assert(sig != self._backend._ffi.NULL)
         return _asn1_string_to_bytes(self._backend, sig)
 
-    @property
+    @utils.cached_property
     def tbs_response_bytes(self) -> bytes:
         self._requires_successful_response()
         respdata = self._backend._lib.OCSP_resp_get0_respdata(self._basic)
@@ -188,7 +199,7 @@ class _OCSPResponse(OCSPResponse):
 
         return certs
 
-    @property
+    @utils.cached_property
     def responder_key_hash(self) -> typing.Optional[bytes]:
         self._requires_successful_response()
         _, asn1_string = self._responder_key_name()
@@ -197,7 +208,7 @@ class _OCSPResponse(OCSPResponse):
         else:
             return _asn1_string_to_bytes(self._backend, asn1_string)
 
-    @property
+    @utils.cached_property
     def responder_name(self) -> typing.Optional[x509.Name]:
         self._requires_successful_response()
         x509_name, _ = self._responder_key_name()
@@ -215,7 +226,7 @@ class _OCSPResponse(OCSPResponse):
         self._backend.openssl_assert(res == 1)
         return x509_name[0], asn1_string[0]
 
-    @property
+    @utils.cached_property
     def produced_at(self) -> datetime.datetime:
         self._requires_successful_response()
         produced_at = self._backend._lib.OCSP_resp_get0_produced_at(
@@ -223,7 +234,7 @@ class _OCSPResponse(OCSPResponse):
         )
         return _parse_asn1_generalized_time(self._backend, produced_at)
 
-    @property
+    @utils.cached_property
     def certificate_status(self) -> OCSPCertStatus:
         self._requires_successful_response()
         status = self._backend._lib.OCSP_single_get0_status(
@@ -233,10 +244,12 @@ class _OCSPResponse(OCSPResponse):
             self._backend._ffi.NULL,
             self._backend._ffi.NULL,
         )
-        self._backend.openssl_assert(status in _CERT_STATUS_TO_ENUM)
-        return _CERT_STATUS_TO_ENUM[status]
+        self._backend.openssl_assert(
+            status in OCSPCertStatus._value2member_map_
+        )
+        return OCSPCertStatus(status)
 
-    @property
+    @utils.cached_property
     def revocation_time(self) -> typing.Optional[datetime.datetime]:
         self._requires_successful_response()
         if self.certificate_status is not OCSPCertStatus.REVOKED:
@@ -253,7 +266,7 @@ class _OCSPResponse(OCSPResponse):
         self._backend.openssl_assert(asn1_time[0] != self._backend._ffi.NULL)
         return _parse_asn1_generalized_time(self._backend, asn1_time[0])
 
-    @property
+    @utils.cached_property
     def revocation_reason(self) -> typing.Optional[x509.ReasonFlags]:
         self._requires_successful_response()
         if self.certificate_status is not OCSPCertStatus.REVOKED:
@@ -276,7 +289,7 @@ class _OCSPResponse(OCSPResponse):
             )
             return _CRL_ENTRY_REASON_CODE_TO_ENUM[reason_ptr[0]]
 
-    @property
+    @utils.cached_property
     def this_update(self) -> datetime.datetime:
         self._requires_successful_response()
         asn1_time = self._backend._ffi.new("ASN1_GENERALIZEDTIME **")
@@ -290,7 +303,7 @@ class _OCSPResponse(OCSPResponse):
         self._backend.openssl_assert(asn1_time[0] != self._backend._ffi.NULL)
         return _parse_asn1_generalized_time(self._backend, asn1_time[0])
 
-    @property
+    @utils.cached_property
     def next_update(self) -> typing.Optional[datetime.datetime]:
         self._requires_successful_response()
         asn1_time = self._backend._ffi.new("ASN1_GENERALIZEDTIME **")
@@ -306,22 +319,22 @@ class _OCSPResponse(OCSPResponse):
         else:
             return None
 
-    @property
+    @utils.cached_property
     def issuer_key_hash(self) -> bytes:
         self._requires_successful_response()
         return _issuer_key_hash(self._backend, self._cert_id)
 
-    @property
+    @utils.cached_property
     def issuer_name_hash(self) -> bytes:
         self._requires_successful_response()
         return _issuer_name_hash(self._backend, self._cert_id)
 
-    @property
+    @utils.cached_property
     def hash_algorithm(self) -> hashes.HashAlgorithm:
         self._requires_successful_response()
         return _hash_algorithm(self._backend, self._cert_id)
 
-    @property
+    @utils.cached_property
     def serial_number(self) -> int:
         self._requires_successful_response()
         return _serial_number(self._backend, self._cert_id)
@@ -363,19 +376,19 @@ class _OCSPRequest(OCSPRequest):
         self._cert_id = self._backend._lib.OCSP_onereq_get0_id(self._request)
         self._backend.openssl_assert(self._cert_id != self._backend._ffi.NULL)
 
-    @property
+    @utils.cached_property
     def issuer_key_hash(self) -> bytes:
         return _issuer_key_hash(self._backend, self._cert_id)
 
-    @property
+    @utils.cached_property
     def issuer_name_hash(self) -> bytes:
         return _issuer_name_hash(self._backend, self._cert_id)
 
-    @property
+    @utils.cached_property
     def serial_number(self) -> int:
         return _serial_number(self._backend, self._cert_id)
 
-    @property
+    @utils.cached_property
     def hash_algorithm(self) -> hashes.HashAlgorithm:
         return _hash_algorithm(self._backend, self._cert_id)
 
@@ -39,7 +39,7 @@ class AttributeNotFound(Exception):
 
 def _reject_duplicate_extension(
     extension: Extension[ExtensionType],
-    extensions: typing.List[Extension[ExtensionType]],
+    extensions: typing.Iterable[Extension[ExtensionType]],
 ) -> None:
     # This is quadratic in the number of extensions
     for e in extensions:
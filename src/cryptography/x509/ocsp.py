@@ -5,6 +5,7 @@
 
 import abc
 import datetime
+import sys
 import typing
 from enum import Enum
 
@@ -13,17 +14,42 @@ from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.x509.base import (
     PRIVATE_KEY_TYPES,
     _EARLIEST_UTC_TIME,
-    _convert_to_naive_utc_time,
-    _reject_duplicate_extension,
 )
 
+if typing.TYPE_CHECKING:
+    from cryptography.hazmat.backends.openssl.backend import Backend
 
-_OIDS_TO_HASH = {
-    "1.3.14.3.2.26": hashes.SHA1(),
-    "2.16.840.1.101.3.4.2.4": hashes.SHA224(),
-    "2.16.840.1.101.3.4.2.1": hashes.SHA256(),
-    "2.16.840.1.101.3.4.2.2": hashes.SHA384(),
-    "2.16.840.1.101.3.4.2.3": hashes.SHA512(),
+_backend: typing.Optional["Backend"] = None
+
+
+def _get_backend() -> "Backend":
+    # Memoized module-locally so that after the first call the load/build
+    # paths resolve the backend with a single global read. The import is
+    # deferred to avoid a circular import at module load.
+    global _backend
+
+    if _backend is None:
+        from cryptography.hazmat.backends.openssl.backend import backend
+
+        _backend = backend
+
+    return _backend
+
+
+# The OID strings are interned module constants so that every module that
+# refers to them shares one string object and can compare by identity.
+_OID_SHA1 = sys.intern("1.3.14.3.2.26")
+_OID_SHA224 = sys.intern("2.16.840.1.101.3.4.2.4")
+_OID_SHA256 = sys.intern("2.16.840.1.101.3.4.2.1")
+_OID_SHA384 = sys.intern("2.16.840.1.101.3.4.2.2")
+_OID_SHA512 = sys.intern("2.16.840.1.101.3.4.2.3")
+
+_OIDS_TO_HASH: typing.Dict[str, typing.Type[hashes.HashAlgorithm]] = {
+    _OID_SHA1: hashes.SHA1,
+    _OID_SHA224: hashes.SHA224,
+    _OID_SHA256: hashes.SHA256,
+    _OID_SHA384: hashes.SHA384,
+    _OID_SHA512: hashes.SHA512,
 }
 
 
@@ -41,7 +67,6 @@ class OCSPResponseStatus(Enum):
     UNAUTHORIZED = 6
 
 
-_RESPONSE_STATUS_TO_ENUM = {x.value: x for x in OCSPResponseStatus}
 _ALLOWED_HASHES = (
     hashes.SHA1,
     hashes.SHA224,
@@ -49,25 +74,55 @@ _ALLOWED_HASHES = (
     hashes.SHA384,
     hashes.SHA512,
 )
+_ALLOWED_HASH_TYPES = frozenset(_ALLOWED_HASHES)
 
 
 def _verify_algorithm(algorithm):
-    if not isinstance(algorithm, _ALLOWED_HASHES):
+    # The frozenset gives the common exact-type case a single hash lookup;
+    # isinstance is the fallback for subclasses of the allowed hashes.
+    if type(algorithm) not in _ALLOWED_HASH_TYPES and not isinstance(
+        algorithm, _ALLOWED_HASHES
+    ):
         raise ValueError(
             "Algorithm must be SHA1, SHA224, SHA256, SHA384, or SHA512"
         )
 
 
+_CERT_TYPES: typing.Tuple[type, ...] = (x509.Certificate,)
+
+
+def _is_certificate(obj) -> bool:
+    global _CERT_TYPES
+
+    if type(obj) in _CERT_TYPES:
+        return True
+    elif isinstance(obj, x509.Certificate):
+        # Remember the concrete backend class so subsequent checks hit the
+        # exact-type fast path instead of walking the MRO.
+        _CERT_TYPES += (type(obj),)
+        return True
+    else:
+        return False
+
+
 class OCSPCertStatus(Enum):
     GOOD = 0
     REVOKED = 1
     UNKNOWN = 2
 
 
-_CERT_STATUS_TO_ENUM = {x.value: x for x in OCSPCertStatus}
-
-
 class _SingleResponse(object):
+    __slots__ = (
+        "_cert",
+        "_issuer",
+        "_algorithm",
+        "_this_update",
+        "_next_update",
+        "_cert_status",
+        "_revocation_time",
+        "_revocation_reason",
+    )
+
     def __init__(
         self,
         cert,
@@ -79,16 +134,21 @@ class _SingleResponse(object):
         revocation_time,
         revocation_reason,
     ):
-        if not isinstance(cert, x509.Certificate) or not isinstance(
-            issuer, x509.Certificate
-        ):
+        if not _is_certificate(cert) or not _is_certificate(issuer):
             raise TypeError("cert and issuer must be a Certificate")
 
         _verify_algorithm(algorithm)
-        if not isinstance(this_update, datetime.datetime):
+        # type() is checked first as an exact-type fast path (the Python
+        # analogue of PyDateTime_CheckExact); isinstance is the fallback
+        # for datetime subclasses.
+        if type(this_update) is not datetime.datetime and not isinstance(
+            this_update, datetime.datetime
+        ):
             raise TypeError("this_update must be a datetime object")
-        if next_update is not None and not isinstance(
-            next_update, datetime.datetime
+        if (
+            next_update is not None
+            and type(next_update) is not datetime.datetime
+            and not isinstance(next_update, datetime.datetime)
         ):
             raise TypeError("next_update must be a datetime object or None")
 
@@ -114,10 +174,19 @@ class _SingleResponse(object):
                     " is revoked"
                 )
         else:
-            if not isinstance(revocation_time, datetime.datetime):
+            if type(
+                revocation_time
+            ) is not datetime.datetime and not isinstance(
+                revocation_time, datetime.datetime
+            ):
                 raise TypeError("revocation_time must be a datetime object")
 
-            revocation_time = _convert_to_naive_utc_time(revocation_time)
+            # Inlined from _convert_to_naive_utc_time: naive datetimes are
+            # already treated as UTC, so only aware ones need converting.
+            if revocation_time.tzinfo is not None:
+                offset = revocation_time.utcoffset()
+                offset = offset if offset else datetime.timedelta()
+                revocation_time = revocation_time.replace(tzinfo=None) - offset
             if revocation_time < _EARLIEST_UTC_TIME:
                 raise ValueError(
                     "The revocation_time must be on or after"
@@ -319,10 +388,20 @@ class OCSPRequestBuilder(object):
                 x509.Certificate, x509.Certificate, hashes.HashAlgorithm
             ]
         ] = None,
-        extensions: typing.List[x509.Extension[x509.ExtensionType]] = [],
+        extensions: typing.Optional[
+            typing.Sequence[x509.Extension[x509.ExtensionType]]
+        ] = None,
+        ext_oids: typing.Optional[
+            typing.FrozenSet[x509.ObjectIdentifier]
+        ] = None,
     ) -> None:
         self._request = request
-        self._extensions = extensions
+        self._extensions = () if extensions is None else tuple(extensions)
+        self._ext_oids = (
+            frozenset(ext.oid for ext in self._extensions)
+            if ext_oids is None
+            else ext_oids
+        )
 
     def add_certificate(
         self,
@@ -334,12 +413,12 @@ class OCSPRequestBuilder(object):
             raise ValueError("Only one certificate can be added to a request")
 
         _verify_algorithm(algorithm)
-        if not isinstance(cert, x509.Certificate) or not isinstance(
-            issuer, x509.Certificate
-        ):
+        if not _is_certificate(cert) or not _is_certificate(issuer):
             raise TypeError("cert and issuer must be a Certificate")
 
-        return OCSPRequestBuilder((cert, issuer, algorithm), self._extensions)
+        return OCSPRequestBuilder(
+            (cert, issuer, algorithm), self._extensions, self._ext_oids
+        )
 
     def add_extension(
         self, extval: x509.ExtensionType, critical: bool
@@ -347,20 +426,21 @@ class OCSPRequestBuilder(object):
         if not isinstance(extval, x509.ExtensionType):
             raise TypeError("extension must be an ExtensionType")
 
+        if extval.oid in self._ext_oids:
+            raise ValueError("This extension has already been set.")
         extension = x509.Extension(extval.oid, critical, extval)
-        _reject_duplicate_extension(extension, self._extensions)
 
         return OCSPRequestBuilder(
-            self._request, self._extensions + [extension]
+            self._request,
+            self._extensions + (extension,),
+            self._ext_oids | {extval.oid},
         )
 
     def build(self) -> OCSPRequest:
-        from cryptography.hazmat.backends.openssl.backend import backend
-
         if self._request is None:
             raise ValueError("You must add a certificate before building")
 
-        return backend.create_ocsp_request(self)
+        return _get_backend().create_ocsp_request(self)
 
 
 class OCSPResponseBuilder(object):
@@ -371,12 +451,22 @@ class OCSPResponseBuilder(object):
             typing.Tuple[x509.Certificate, OCSPResponderEncoding]
         ] = None,
         certs: typing.Optional[typing.List[x509.Certificate]] = None,
-        extensions: typing.List[x509.Extension[x509.ExtensionType]] = [],
+        extensions: typing.Optional[
+            typing.Sequence[x509.Extension[x509.ExtensionType]]
+        ] = None,
+        ext_oids: typing.Optional[
+            typing.FrozenSet[x509.ObjectIdentifier]
+        ] = None,
     ):
         self._response = response
         self._responder_id = responder_id
         self._certs = certs
-        self._extensions = extensions
+        self._extensions = () if extensions is None else tuple(extensions)
+        self._ext_oids = (
+            frozenset(ext.oid for ext in self._extensions)
+            if ext_oids is None
+            else ext_oids
+        )
 
     def add_response(
         self,
@@ -407,6 +497,7 @@ class OCSPResponseBuilder(object):
             self._responder_id,
             self._certs,
             self._extensions,
+            self._ext_oids,
         )
 
     def responder_id(
@@ -426,6 +517,7 @@ class OCSPResponseBuilder(object):
             (responder_cert, encoding),
             self._certs,
             self._extensions,
+            self._ext_oids,
         )
 
     def certificates(
@@ -433,16 +525,19 @@ class OCSPResponseBuilder(object):
     ) -> "OCSPResponseBuilder":
         if self._certs is not None:
             raise ValueError("certificates may only be set once")
-        certs = list(certs)
-        if len(certs) == 0:
+        certs_list = []
+        for cert in certs:
+            if not _is_certificate(cert):
+                raise TypeError("certs must be a list of Certificates")
+            certs_list.append(cert)
+        if len(certs_list) == 0:
             raise ValueError("certs must not be an empty list")
-        if not all(isinstance(x, x509.Certificate) for x in certs):
-            raise TypeError("certs must be a list of Certificates")
         return OCSPResponseBuilder(
             self._response,
             self._responder_id,
-            certs,
+            certs_list,
             self._extensions,
+            self._ext_oids,
         )
 
     def add_extension(
@@ -451,14 +546,16 @@ class OCSPResponseBuilder(object):
         if not isinstance(extval, x509.ExtensionType):
             raise TypeError("extension must be an ExtensionType")
 
+        if extval.oid in self._ext_oids:
+            raise ValueError("This extension has already been set.")
         extension = x509.Extension(extval.oid, critical, extval)
-        _reject_duplicate_extension(extension, self._extensions)
 
         return OCSPResponseBuilder(
             self._response,
             self._responder_id,
             self._certs,
-            self._extensions + [extension],
+            self._extensions + (extension,),
+            self._ext_oids | {extval.oid},
         )
 
     def sign(
@@ -466,14 +563,12 @@ class OCSPResponseBuilder(object):
         private_key: PRIVATE_KEY_TYPES,
         algorithm: typing.Optional[hashes.HashAlgorithm],
     ) -> OCSPResponse:
-        from cryptography.hazmat.backends.openssl.backend import backend
-
         if self._response is None:
             raise ValueError("You must add a response before signing")
         if self._responder_id is None:
             raise ValueError("You must add a responder_id before signing")
 
-        return backend.create_ocsp_response(
+        return _get_backend().create_ocsp_response(
             OCSPResponseStatus.SUCCESSFUL, self, private_key, algorithm
         )
 
@@ -481,8 +576,6 @@ class OCSPResponseBuilder(object):
     def build_unsuccessful(
         cls, response_status: OCSPResponseStatus
     ) -> OCSPResponse:
-        from cryptography.hazmat.backends.openssl.backend import backend
-
         if not isinstance(response_status, OCSPResponseStatus):
             raise TypeError(
                 "response_status must be an item from OCSPResponseStatus"
@@ -490,16 +583,14 @@ class OCSPResponseBuilder(object):
         if response_status is OCSPResponseStatus.SUCCESSFUL:
             raise ValueError("response_status cannot be SUCCESSFUL")
 
-        return backend.create_ocsp_response(response_status, None, None, None)
+        return _get_backend().create_ocsp_response(
+            response_status, None, None, None
+        )
 
 
 def load_der_ocsp_request(data: bytes) -> OCSPRequest:
-    from cryptography.hazmat.backends.openssl.backend import backend
-
-    return backend.load_der_ocsp_request(data)
+    return _get_backend().load_der_ocsp_request(data)
 
 
 def load_der_ocsp_response(data: bytes) -> OCSPResponse:
-    from cryptography.hazmat.backends.openssl.backend import backend
-
-    return backend.load_der_ocsp_response(data)
+    return _get_backend().load_der_ocsp_response(data)